@@ -0,0 +1,6 @@
+"""Allow running qimu as ``python -m qimu``."""
+
+from qimu.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,104 @@
 """Main CLI entry point for qimu."""
 
+from __future__ import annotations
+
+import importlib
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import rich_click as click
-from rich.console import Console
-
-from qimu.utils.config_handler import ConfigHandler
-from qimu.utils.logger import setup_logging
 
-# Configure rich-click
-click.rich_click.TEXT_MARKUP = True
-click.rich_click.SHOW_ARGUMENTS = True
-click.rich_click.GROUP_ARGUMENTS_OPTIONS = True
+if TYPE_CHECKING:
+    import logging
 
-# Console for stderr output
-console = Console(stderr=True)
+    from qimu.utils.config_handler import ConfigHandler
 
 # Context settings to enable -h for help
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
+# rich-click help settings, inherited by the subcommand contexts. Passing them
+# through the context avoids mutating rich-click globals at import time.
+RICH_HELP_CONFIG = {
+    "text_markup": "rich",
+    "show_arguments": True,
+    "group_arguments_options": True,
+}
 
-class Context:
-    """Shared context for CLI commands."""
+# Subcommands, as "module:attribute" import paths resolved on dispatch
+SUBCOMMANDS = {
+    "version": "qimu.commands.version:version",
+    "config": "qimu.commands.config:config",
+    "reads-table": "qimu.commands.reads_table:reads_table",
+}
+
+
+class LazyGroup(click.RichGroup):
+    """Group that imports subcommand modules only when they are invoked."""
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
 
-    def __init__(self):
-        self.config: ConfigHandler | None = None
-        self.logger = None
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name):
+        module_name, attr_name = self.lazy_subcommands[cmd_name].split(":", 1)
+        module = importlib.import_module(module_name)
+        return getattr(module, attr_name)
+
+
+class Context:
+    """Shared context for CLI commands.
 
+    The logger and config handler are created on first access.
+    """
 
-@click.group(context_settings=CONTEXT_SETTINGS)
+    __slots__ = ("_config_file", "_log_options", "_config", "_logger")
+
+    def __init__(
+        self,
+        config_file: Path | None = None,
+        verbose: bool = False,
+        debug: bool = False,
+        log_file: Path | None = None,
+    ):
+        self._config_file = config_file
+        self._log_options = {"verbose": verbose, "debug": debug, "log_file": log_file}
+        self._config: ConfigHandler | None = None
+        self._logger: logging.Logger | None = None
+
+    @property
+    def logger(self) -> logging.Logger:
+        """Application logger, set up on first access."""
+        if self._logger is None:
+            from qimu.utils.logger import setup_logging
+
+            self._logger = setup_logging(**self._log_options)
+        return self._logger
+
+    @property
+    def config(self) -> ConfigHandler:
+        """Config handler, loaded on first access."""
+        if self._config is None:
+            from qimu.utils.config_handler import ConfigHandler
+
+            self._config = ConfigHandler(self._config_file)
+            self.logger.debug(f"Using config file: {self._config.config_path}")
+        return self._config
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands=SUBCOMMANDS,
+    context_settings={**CONTEXT_SETTINGS, "rich_help_config": RICH_HELP_CONFIG},
+)
 @click.option(
     "-c",
     "--config",
@@ -59,34 +128,26 @@ def cli(ctx, config_file: Path | None, debug: bool, verbose: bool, log_file: Pat
 
     Use [bold]qimu [SUBCOMMAND] --help[/bold] for help on specific subcommands.
     """
-    # Initialize shared context
-    ctx.obj = Context()
-
-    # Set up logging
-    ctx.obj.logger = setup_logging(verbose=verbose, debug=debug, log_file=log_file)
-
-    # Initialize config handler
-    ctx.obj.config = ConfigHandler(config_file)
-
-    ctx.obj.logger.debug(f"Using config file: {ctx.obj.config.config_path}")
-
-
-# Import and register subcommands at module level
-from qimu.commands import config as config_cmd
-from qimu.commands import reads_table as reads_table_cmd
-from qimu.commands import version as version_cmd
-
-cli.add_command(version_cmd.version)
-cli.add_command(config_cmd.config)
-cli.add_command(reads_table_cmd.reads_table)
+    # Initialize shared context (logging and config are set up on first use)
+    ctx.obj = Context(config_file, verbose=verbose, debug=debug, log_file=log_file)
 
 
 def main():
     """Main entry point."""
+    # Fast path: a bare "qimu version" needs no option parsing, logging or config
+    if sys.argv[1:] == ["version"]:
+        from qimu import __version__
+
+        print(__version__)
+        return
+
     try:
         cli()
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        # Click reports its own usage errors; Rich is only needed on this path
+        from rich.console import Console
+
+        Console(stderr=True).print(f"[bold red]Error:[/bold red] {e}")
         sys.exit(1)
 
 
@@ -1,16 +1,21 @@
 """Config subcommand."""
 
-import rich_click as click
-from rich.console import Console
-from rich.table import Table
+from functools import cache
 
-# Console for stderr output (messages)
-console = Console(stderr=True)
+import rich_click as click
 
 # Context settings to enable -h for help
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
 
+@cache
+def _console():
+    """Return the stderr console, importing Rich only on first use."""
+    from rich.console import Console
+
+    return Console(stderr=True)
+
+
 @click.command(context_settings=CONTEXT_SETTINGS)
 @click.option(
     "--set",
@@ -18,7 +23,7 @@ CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
     nargs=2,
     type=str,
     metavar="PARAM VALUE",
-    help="Set a configuration value (use section.param or just param for [qimu] section)",
+    help="Set a configuration value (use section.param or just param for \\[qimu] section)",
 )
 @click.pass_context
 def config(ctx, set_value):
@@ -35,11 +40,16 @@ def config(ctx, set_value):
         section, key = config_handler.parse_param(param)
 
         config_handler.set(key, value, section)
-        console.print(f"[green]✓[/green] Set [bold]{section}.{key}[/bold] = [cyan]{value}[/cyan]")
-        console.print(f"Configuration saved to: {config_handler.config_path}")
+        click.echo(
+            f"{click.style('✓', fg='green')} Set {click.style(f'{section}.{key}', bold=True)}"
+            f" = {click.style(value, fg='cyan')}",
+            err=True,
+        )
+        click.echo(f"Configuration saved to: {config_handler.config_path}", err=True)
     else:
         # Display current configuration
         all_config = config_handler.get_all()
+        console = _console()
 
         if not all_config or not any(all_config.values()):
             console.print("[yellow]No configuration found.[/yellow]")
@@ -48,6 +58,8 @@ def config(ctx, set_value):
             return
 
         # Create a nice table for display
+        from rich.table import Table
+
         table = Table(title="qimu Configuration", show_header=True, header_style="bold magenta")
         table.add_column("Section", style="cyan")
         table.add_column("Parameter", style="green")
@@ -1,19 +1,51 @@
 """Reads-table subcommand."""
 
 import sys
+from functools import cache
 from pathlib import Path
 
 import rich_click as click
-from rich.console import Console
-
-from qimu.utils.reads_paths import build_sequenced_run
-
-# Console for stderr output (messages)
-console = Console(stderr=True)
 
 # Context settings to enable -h for help
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
+# Predefined output formats, as write_table() keyword arguments.
+# All presets use absolute paths.
+FORMAT_PRESETS = {
+    # Simple manifest format: sample-id,forward,reverse
+    "manifest": {
+        "separator": ",",
+        "col_id": "sample-id",
+        "col_for": "forward-absolute-filepath",
+        "col_rev": "reverse-absolute-filepath",
+        "absolute": True,
+    },
+    # QIIME2 ampliseq format
+    "ampliseq": {
+        "separator": "\t",
+        "col_id": "sample-id",
+        "col_for": "forward-absolute-filepath",
+        "col_rev": "reverse-absolute-filepath",
+        "absolute": True,
+    },
+    # MAG pipeline format
+    "mag": {
+        "separator": ",",
+        "col_id": "sample",
+        "col_for": "R1",
+        "col_rev": "R2",
+        "absolute": True,
+    },
+}
+
+
+@cache
+def _console():
+    """Return the stderr console, importing Rich only on first use."""
+    from rich.console import Console
+
+    return Console(stderr=True)
+
 
 @click.command("reads-table", context_settings=CONTEXT_SETTINGS)
 @click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True, path_type=Path))
@@ -128,6 +160,8 @@ def reads_table(
         # Generate manifest with absolute paths
         qimu reads-table /path/to/reads/ --abs
     """
+    from qimu.utils.reads_paths import build_sequenced_run
+
     logger = ctx.obj.logger
 
     try:
@@ -145,16 +179,16 @@ def reads_table(
         # Build the sequenced run
         run = build_sequenced_run(
             paths=path_list,
-            extensions=list(extensions),
-            forward_tags=list(tag_for),
-            reverse_tags=list(tag_rev),
-            separators=list(separators),
-            strip_strings=list(strip),
+            extensions=extensions,
+            forward_tags=tag_for,
+            reverse_tags=tag_rev,
+            separators=separators,
+            strip_strings=strip,
             force_single_end=single_end,
         )
 
         if len(run) == 0:
-            console.print("[yellow]Warning:[/yellow] No read files found")
+            _console().print("[yellow]Warning:[/yellow] No read files found")
             sys.exit(0)
 
         logger.info(f"Found {len(run)} samples")
@@ -164,74 +198,45 @@ def reads_table(
 
         # Apply format presets if specified
         if format:
-            output = apply_format_preset(run, format, abs)
+            options = format_preset_options(format)
         else:
             # Generate table with custom options
-            output = run.to_table(
-                separator=tab_sep,
-                col_id=col_id,
-                col_for=col_for,
-                col_rev=col_rev,
-                absolute=abs,
-            )
-
-        # Print to stdout
-        print(output)
+            options = {
+                "separator": tab_sep,
+                "col_id": col_id,
+                "col_for": col_for,
+                "col_rev": col_rev,
+                "absolute": abs,
+            }
+
+        # Stream rows straight to stdout rather than building the whole table
+        run.write_table(sys.stdout, **options)
+        sys.stdout.write("\n")
 
     except ValueError as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        _console().print(f"[bold red]Error:[/bold red] {e}")
         sys.exit(1)
     except Exception as e:
-        console.print(f"[bold red]Unexpected error:[/bold red] {e}")
+        _console().print(f"[bold red]Unexpected error:[/bold red] {e}")
         logger.exception("Unexpected error in reads-table")
         sys.exit(1)
 
 
-def apply_format_preset(run, format_name: str, use_absolute: bool) -> str:
-    """Apply predefined format presets.
+def format_preset_options(format_name: str) -> dict:
+    """Look up the table options of a predefined format preset.
 
     Args:
-        run: SequencedRun object
-        format_name: Name of format preset
-        use_absolute: Whether to use absolute paths
+        format_name: Name of format preset (case-insensitive)
 
     Returns:
-        Formatted output string
+        Keyword arguments for SequencedRun.write_table() / to_table()
 
     Raises:
         ValueError: If format is not recognized
     """
-    format_name = format_name.lower()
-
-    if format_name == "manifest":
-        # Simple manifest format: sample-id,forward,reverse
-        return run.to_table(
-            separator=",",
-            col_id="sample-id",
-            col_for="forward-absolute-filepath",
-            col_rev="reverse-absolute-filepath",
-            absolute=True,  # Manifest always uses absolute paths
-        )
-    elif format_name == "ampliseq":
-        # QIIME2 ampliseq format
-        return run.to_table(
-            separator="\t",
-            col_id="sample-id",
-            col_for="forward-absolute-filepath",
-            col_rev="reverse-absolute-filepath",
-            absolute=True,
-        )
-    elif format_name == "mag":
-        # MAG pipeline format
-        return run.to_table(
-            separator=",",
-            col_id="sample",
-            col_for="R1",
-            col_rev="R2",
-            absolute=True,
-        )
-    else:
+    try:
+        return FORMAT_PRESETS[format_name.lower()]
+    except KeyError:
         raise ValueError(
-            f"Unknown format: {format_name}. "
-            f"Available formats: manifest, ampliseq, mag"
-        )
+            f"Unknown format: {format_name}. Available formats: {', '.join(FORMAT_PRESETS)}"
+        ) from None
@@ -4,11 +4,27 @@ import sys
 
 import rich_click as click
 
-import qimu
+from qimu import __version__
 
 # Context settings to enable -h for help
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
+# Distribution names of the packages reported by --full
+DEPENDENCIES = (
+    "numpy",
+    "pandas",
+    "matplotlib",
+    "seaborn",
+    "scikit-learn",
+    "plotly",
+    "pyfastx",
+    "newick",
+    "pysam",
+    "pyvcf3",
+    "rich",
+    "rich-click",
+)
+
 
 @click.command(context_settings=CONTEXT_SETTINGS)
 @click.option(
@@ -20,53 +36,17 @@ def version(full: bool):
     """Print the version to STDOUT."""
     if full:
         # Print program name and version
-        print(f"qimu {qimu.__version__}")
+        print(f"qimu {__version__}")
 
-        # Print versions of required packages
-        packages = [
-            "numpy",
-            "pandas",
-            "matplotlib",
-            "seaborn",
-            "scikit-learn",
-            "plotly",
-            "pyfastx",
-            "python-newick",
-            "pysam",
-            "pyvcf3",
-            "rich",
-            "rich-click",
-        ]
+        # Read dependency versions from installed metadata, without importing them
+        from importlib.metadata import PackageNotFoundError
+        from importlib.metadata import version as dist_version
 
-        for package in packages:
+        for dist in DEPENDENCIES:
             try:
-                if package == "scikit-learn":
-                    # scikit-learn is imported as sklearn
-                    import sklearn
-
-                    print(f"scikit-learn {sklearn.__version__}")
-                elif package == "python-newick":
-                    # python-newick is imported as newick
-                    import newick
-
-                    print(f"python-newick {newick.__version__}")
-                elif package == "pyvcf3":
-                    # pyvcf3 is imported as vcf
-                    import vcf
-
-                    print(f"pyvcf3 {vcf.__version__}")
-                elif package == "rich-click":
-                    # rich_click is imported with underscore
-                    import rich_click
-
-                    print(f"rich-click {rich_click.__version__}")
-                else:
-                    # Standard import
-                    mod = __import__(package)
-                    print(f"{package} {mod.__version__}")
-            except (ImportError, AttributeError):
-                # If package not found or no __version__, skip it
-                print(f"{package} (not available)", file=sys.stderr)
+                print(f"{dist} {dist_version(dist)}")
+            except PackageNotFoundError:
+                print(f"{dist} (not available)", file=sys.stderr)
     else:
         # Just print the version number
-        print(qimu.__version__)
+        print(__version__)
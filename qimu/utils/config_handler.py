@@ -1,13 +1,24 @@
 """Configuration file handler for qimu."""
 
 import configparser
+import functools
+import io
+import os
+import shutil
 from pathlib import Path
 
+# Internal default configuration, applied before the config file is read
+_DEFAULTS = {"qimu": {}}
+
 
 class ConfigHandler:
     """Handle configuration file reading and writing."""
 
-    DEFAULT_CONFIG_PATH = Path.home() / ".config" / "qimu.ini"
+    @staticmethod
+    @functools.cache
+    def _default_path() -> Path:
+        """Return the default config location (~/.config/qimu.ini)."""
+        return Path.home() / ".config" / "qimu.ini"
 
     def __init__(self, config_path: Path | None = None):
         """Initialize config handler.
@@ -15,20 +26,17 @@ class ConfigHandler:
         Args:
             config_path: Optional custom config file path
         """
-        self.config_path = config_path or self.DEFAULT_CONFIG_PATH
+        self.config_path = config_path or self._default_path()
         self.config = configparser.ConfigParser()
-        self._load_defaults()
+        self._dir_ready = False
+        self.config.read_dict(_DEFAULTS)
         self._load_from_file()
 
-    def _load_defaults(self):
-        """Load internal default configuration."""
-        self.config["qimu"] = {}
-        # Add default values here as needed
-
     def _load_from_file(self):
         """Load configuration from file if it exists."""
-        if self.config_path.exists():
-            self.config.read(self.config_path)
+        # ConfigParser.read() skips files that cannot be opened, so no
+        # separate existence check is needed
+        self.config.read(self.config_path)
 
     def get(self, key: str, section: str = "qimu", fallback: str | None = None) -> str | None:
         """Get a configuration value.
@@ -57,11 +65,33 @@ class ConfigHandler:
         self._save_to_file()
 
     def _save_to_file(self):
-        """Save configuration to file."""
-        # Create parent directory if it doesn't exist
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, "w") as f:
-            self.config.write(f)
+        """Save configuration to file.
+
+        The file is written to a temporary sibling and then renamed over the
+        original, so an interrupted save never leaves a truncated config.
+        Symlinks are followed, and the existing file mode is kept.
+        """
+        # Write next to the real file, so a symlinked config stays a symlink
+        target = self.config_path.resolve()
+
+        # Create parent directory once per handler
+        if not self._dir_ready:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+
+        buffer = io.StringIO()
+        self.config.write(buffer)
+
+        tmp_path = target.with_name(target.name + ".tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                f.write(buffer.getvalue())
+            if target.exists():
+                shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def get_all(self) -> dict:
         """Get all configuration as a dictionary.
@@ -69,7 +99,7 @@ class ConfigHandler:
         Returns:
             Dictionary with all sections and their values
         """
-        return {section: dict(self.config[section]) for section in self.config.sections()}
+        return {section: dict(self.config.items(section)) for section in self.config.sections()}
 
     def parse_param(self, param: str) -> tuple[str, str]:
         """Parse parameter in format 'section.key' or 'key'.
@@ -80,7 +110,7 @@ class ConfigHandler:
         Returns:
             Tuple of (section, key)
         """
-        if "." in param:
-            section, key = param.split(".", 1)
+        section, sep, key = param.partition(".")
+        if sep:
             return section, key
         return "qimu", param
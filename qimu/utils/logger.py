@@ -3,7 +3,9 @@
 import logging
 from pathlib import Path
 
-from rich.logging import RichHandler
+# Formatters are stateless, so one instance of each is shared by all handlers
+_CONSOLE_FMT = logging.Formatter("%(message)s")
+_FILE_FMT = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
 
 def setup_logging(
@@ -19,6 +21,8 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
+    from rich.logging import RichHandler
+
     # Determine log level
     if debug:
         level = logging.DEBUG
@@ -32,7 +36,8 @@ def setup_logging(
     logger.setLevel(level)
 
     # Remove existing handlers
-    logger.handlers.clear()
+    if logger.handlers:
+        logger.handlers.clear()
 
     # Add rich handler for stderr
     console_handler = RichHandler(
@@ -42,16 +47,14 @@ def setup_logging(
         show_path=debug,  # Only show path in debug mode
     )
     console_handler.setLevel(level)
-    console_formatter = logging.Formatter("%(message)s")
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_CONSOLE_FMT)
     logger.addHandler(console_handler)
 
     # Add file handler if log_file specified
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(level)
-        file_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        file_handler.setFormatter(file_formatter)
+        file_handler.setFormatter(_FILE_FMT)
         logger.addHandler(file_handler)
 
     return logger
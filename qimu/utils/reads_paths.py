@@ -1,10 +1,29 @@
 """Classes and utilities for handling sequencing reads."""
 
+import functools
+import io
+import logging
 import os
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from itertools import repeat
+from operator import attrgetter
 from pathlib import Path
+from typing import TextIO
+
+logger = logging.getLogger(__name__)
+
+# ASCII characters other than [a-zA-Z0-9], for str.strip()
+_NON_ALNUM_ASCII = "".join(c for c in map(chr, range(128)) if not c.isalnum())
+
+# Leading or trailing runs of non-alphanumeric characters (non-ASCII fallback)
+_STRIP_RE = re.compile(r"^[^a-zA-Z0-9]+|[^a-zA-Z0-9]+$")
+
+# Common read file extensions (.fastq, .fq, optionally gzipped)
+_READ_EXT_RE = re.compile(r"\.(?:fastq|fq)(?:\.gz)?\Z")
 
 
 class ReadType(Enum):
@@ -18,11 +37,23 @@ class ReadType(Enum):
 class SequencedSample:
     """Represents a sequenced sample with its reads."""
 
+    __slots__ = (
+        "id",
+        "type",
+        "pwd",
+        "_reads",
+        "_reads_absolute",
+        "_pwd_prefix",
+        "_abs_strs",
+        "_rel_strs",
+        "_rel_to_strs",
+    )
+
     def __init__(
         self,
         sample_id: str,
         read_type: ReadType,
-        reads: list[Path],
+        reads: list[str | Path],
         pwd: Path | None = None,
     ):
         """Initialize a sequenced sample.
@@ -35,9 +66,16 @@ class SequencedSample:
         """
         self.id = sample_id
         self.type = read_type
-        # Store absolute paths internally
-        self.reads_absolute = [Path(r).resolve() for r in reads]
+        # Paths are resolved to absolute on first use (see reads_absolute)
+        self._reads = [Path(r) for r in reads]
+        self._reads_absolute: list[Path] | None = None
         self.pwd = pwd or Path.cwd()
+        # PWD with a trailing separator, for relative paths by prefix stripping
+        self._pwd_prefix = os.path.join(str(self.pwd), "")
+        # Cached path strings, filled in by get_reads()
+        self._abs_strs: tuple[str, ...] | None = None
+        self._rel_strs: tuple[str, ...] | None = None
+        self._rel_to_strs: dict[Path, tuple[str, ...]] | None = None
 
         # Validate read count matches type
         if read_type == ReadType.SINGLE_END and len(reads) != 1:
@@ -45,9 +83,18 @@ class SequencedSample:
         elif read_type == ReadType.PAIRED_END and len(reads) != 2:
             raise ValueError(f"Paired-end sample must have 2 read files, got {len(reads)}")
 
+    @property
+    def reads_absolute(self) -> list[Path]:
+        """Absolute (resolved) read paths, computed once on first access."""
+        if self._reads_absolute is None:
+            self._reads_absolute = [r.resolve() for r in self._reads]
+        return self._reads_absolute
+
     def get_reads(self, absolute: bool = False, relative_to: Path | None = None) -> list[str]:
         """Get read paths.
 
+        The path strings are computed once per mode and cached.
+
         Args:
             absolute: Return absolute paths
             relative_to: Make paths relative to this directory (overrides absolute)
@@ -56,24 +103,63 @@ class SequencedSample:
             List of read paths as strings
         """
         if relative_to:
-            return [str(p.relative_to(relative_to)) for p in self.reads_absolute]
+            if self._rel_to_strs is None:
+                self._rel_to_strs = {}
+            reads = self._rel_to_strs.get(relative_to)
+            if reads is None:
+                reads = tuple(str(p.relative_to(relative_to)) for p in self.reads_absolute)
+                self._rel_to_strs[relative_to] = reads
         elif absolute:
-            return [str(p) for p in self.reads_absolute]
+            if self._abs_strs is None:
+                self._abs_strs = tuple(str(p) for p in self.reads_absolute)
+            reads = self._abs_strs
         else:
-            # Relative to PWD
-            return [str(p.relative_to(self.pwd)) for p in self.reads_absolute]
+            if self._rel_strs is None:
+                self._rel_strs = self._relative_to_pwd()
+            reads = self._rel_strs
+        return list(reads)
+
+    def _relative_to_pwd(self) -> tuple[str, ...]:
+        """Compute read paths relative to PWD.
+
+        The PWD prefix is stripped from the path string; Path.relative_to()
+        (which raises for paths outside PWD) is only used when it does not match.
+
+        Returns:
+            Tuple of relative read paths as strings
+        """
+        prefix = self._pwd_prefix
+        reads = []
+        for p in self.reads_absolute:
+            full = str(p)
+            if full.startswith(prefix):
+                reads.append(full[len(prefix) :])
+            else:
+                reads.append(str(p.relative_to(self.pwd)))
+        return tuple(reads)
 
     def __repr__(self):
-        return f"SequencedSample(id={self.id}, type={self.type.value}, reads={len(self.reads_absolute)})"
+        return f"SequencedSample(id={self.id}, type={self.type.value}, reads={len(self._reads)})"
 
 
 class SequencedRun:
     """Represents a collection of sequenced samples."""
 
+    __slots__ = ("_samples_by_id", "_pe_count", "_se_count", "_sorted_samples")
+
     def __init__(self):
         """Initialize an empty sequenced run."""
-        self.samples: list[SequencedSample] = []
-        self._sample_ids: set[str] = set()
+        self._samples_by_id: dict[str, SequencedSample] = {}
+        # Read type counts, so type checks do not need to scan all samples
+        self._pe_count = 0
+        self._se_count = 0
+        # Samples sorted by ID, cached until the next add_sample()
+        self._sorted_samples: tuple[SequencedSample, ...] | None = None
+
+    @property
+    def samples(self) -> list[SequencedSample]:
+        """Samples in insertion order."""
+        return list(self._samples_by_id.values())
 
     def add_sample(self, sample: SequencedSample):
         """Add a sample to the run.
@@ -84,11 +170,28 @@ class SequencedRun:
         Raises:
             ValueError: If sample ID already exists
         """
-        if sample.id in self._sample_ids:
+        # One hash lookup both checks for a duplicate and inserts the sample
+        if self._samples_by_id.setdefault(sample.id, sample) is not sample:
             raise ValueError(f"Duplicate sample ID: {sample.id}")
+        self._sorted_samples = None
 
-        self.samples.append(sample)
-        self._sample_ids.add(sample.id)
+        if sample.type == ReadType.PAIRED_END:
+            self._pe_count += 1
+        elif sample.type == ReadType.SINGLE_END:
+            self._se_count += 1
+
+    def sorted_samples(self) -> tuple[SequencedSample, ...]:
+        """Get samples sorted by ID.
+
+        The sorted list is cached, so repeated calls (e.g. one table per
+        output format) sort only once.
+
+        Returns:
+            Tuple of samples sorted by ID
+        """
+        if self._sorted_samples is None:
+            self._sorted_samples = tuple(sorted(self._samples_by_id.values(), key=attrgetter("id")))
+        return self._sorted_samples
 
     def validate_consistency(self):
         """Validate that all samples are consistent (all PE or all SE).
@@ -96,11 +199,7 @@ class SequencedRun:
         Raises:
             ValueError: If mix of PE and SE samples found
         """
-        if not self.samples:
-            return
-
-        types = {s.type for s in self.samples}
-        if ReadType.SINGLE_END in types and ReadType.PAIRED_END in types:
+        if self._se_count and self._pe_count:
             raise ValueError(
                 "Mixed single-end and paired-end samples found. "
                 "All samples must be of the same type."
@@ -112,7 +211,52 @@ class SequencedRun:
         Returns:
             True if any sample is paired-end
         """
-        return any(s.type == ReadType.PAIRED_END for s in self.samples)
+        return self._pe_count > 0
+
+    def write_table(
+        self,
+        out: TextIO,
+        separator: str = "\t",
+        col_id: str = "SampleId",
+        col_for: str = "reads_R1",
+        col_rev: str = "reads_R2",
+        absolute: bool = False,
+    ) -> None:
+        """Write table representation of the run to a text stream.
+
+        Read paths are resolved for every sample before anything is written,
+        so a path error never leaves a partial table on the stream. No
+        trailing newline is written after the last row.
+
+        Args:
+            out: Writable text stream (e.g. sys.stdout)
+            separator: Column separator
+            col_id: Column name for sample ID
+            col_for: Column name for forward reads
+            col_rev: Column name for reverse reads
+            absolute: Use absolute paths
+
+        Raises:
+            ValueError: If a relative path cannot be computed
+        """
+        if not self._samples_by_id:
+            return
+
+        sep = separator
+        write = out.write
+        rows = [
+            (sample.id, sample.get_reads(absolute=absolute)) for sample in self.sorted_samples()
+        ]
+
+        # The PE/SE choice is made once, outside the loop
+        if self.is_paired_end():
+            write(f"{col_id}{sep}{col_for}{sep}{col_rev}")
+            for sample_id, reads in rows:
+                write(f"\n{sample_id}{sep}{reads[0]}{sep}{reads[1]}")
+        else:
+            write(f"{col_id}{sep}{col_for}")
+            for sample_id, reads in rows:
+                write(f"\n{sample_id}{sep}{reads[0]}")
 
     def to_table(
         self,
@@ -134,34 +278,22 @@ class SequencedRun:
         Returns:
             Table as string
         """
-        if not self.samples:
-            return ""
-
-        is_pe = self.is_paired_end()
-
-        # Build header
-        if is_pe:
-            header = separator.join([col_id, col_for, col_rev])
-        else:
-            header = separator.join([col_id, col_for])
-
-        # Build rows
-        rows = [header]
-        for sample in sorted(self.samples, key=lambda s: s.id):
-            reads = sample.get_reads(absolute=absolute)
-            if is_pe:
-                row = separator.join([sample.id, reads[0], reads[1]])
-            else:
-                row = separator.join([sample.id, reads[0]])
-            rows.append(row)
-
-        return "\n".join(rows)
+        buffer = io.StringIO()
+        self.write_table(
+            buffer,
+            separator=separator,
+            col_id=col_id,
+            col_for=col_for,
+            col_rev=col_rev,
+            absolute=absolute,
+        )
+        return buffer.getvalue()
 
     def __len__(self):
-        return len(self.samples)
+        return len(self._samples_by_id)
 
     def __repr__(self):
-        return f"SequencedRun(samples={len(self.samples)})"
+        return f"SequencedRun(samples={len(self._samples_by_id)})"
 
 
 def strip_non_alphanumeric(text: str) -> str:
@@ -173,21 +305,86 @@ def strip_non_alphanumeric(text: str) -> str:
     Returns:
         Stripped string
     """
-    # Remove non-alphanumeric from start
-    text = re.sub(r"^[^a-zA-Z0-9]+", "", text)
-    # Remove non-alphanumeric from end
-    text = re.sub(r"[^a-zA-Z0-9]+$", "", text)
-    return text
+    if text.isascii():
+        return text.strip(_NON_ALNUM_ASCII)
+    # Non-ASCII letters and digits count as non-alphanumeric here, which
+    # str.strip() cannot express without listing them all
+    return _STRIP_RE.sub("", text)
 
 
-def extract_sample_name(
+@functools.cache
+def _alternation(strings: tuple[str, ...]) -> re.Pattern | None:
+    """Compile a pattern matching any of the literal strings.
+
+    Alternatives are tried in the order given. Patterns are cached per tuple
+    of strings, so each tag set is compiled only once per process.
+    """
+    literals = tuple(dict.fromkeys(s for s in strings if s))
+    if not literals:
+        return None
+    return re.compile("|".join(map(re.escape, literals)))
+
+
+@functools.cache
+def _literals_overlap(strings: tuple[str, ...]) -> bool:
+    """Check whether occurrences of two of the literal strings can overlap.
+
+    That is the case when one string contains another, or ends with the start
+    of another. A single alternation pass can then match differently from
+    replacing the strings one after the other.
+    """
+    literals = tuple(dict.fromkeys(s for s in strings if s))
+    for a in literals:
+        for b in literals:
+            if a == b:
+                continue
+            if b in a or any(a.endswith(b[:k]) for k in range(1, min(len(a), len(b)))):
+                return True
+    return False
+
+
+def _replace_literals(text: str, strings: tuple[str, ...], repl: str) -> tuple[str, bool]:
+    """Replace the literal strings in text, as str.replace() calls in order would.
+
+    Strings that cannot overlap are replaced in a single pass of a cached
+    alternation; otherwise they are replaced one after the other.
+
+    Args:
+        text: Text to search
+        strings: Literal strings to replace (empty strings are ignored)
+        repl: Replacement string
+
+    Returns:
+        Tuple of (new text, whether any of the strings was found)
+    """
+    pattern = _alternation(strings)
+    if pattern is None:
+        return text, False
+    if not _literals_overlap(strings):
+        text, count = pattern.subn(repl, text)
+        return text, count > 0
+
+    found = False
+    for string in strings:
+        if string and string in text:
+            text = text.replace(string, repl)
+            found = True
+    return text, found
+
+
+@functools.cache
+def _tokenize_sample_name(
     filename: str,
-    separators: list[str],
-    forward_tags: list[str],
-    reverse_tags: list[str],
-    strip_strings: list[str],
-) -> str:
-    """Extract sample name from filename.
+    separators: tuple[str, ...],
+    forward_tags: tuple[str, ...],
+    reverse_tags: tuple[str, ...],
+    strip_strings: tuple[str, ...],
+) -> tuple[str, ...]:
+    """Extract the parts of a sample name from a filename.
+
+    The parts are those of the extracted sample name split by the first
+    separator, so joining them with it gives the name back. Results are
+    cached, so all arguments must be hashable (pass tuples).
 
     Args:
         filename: Filename (without directory)
@@ -197,41 +394,56 @@ def extract_sample_name(
         strip_strings: Strings to remove from anywhere in name
 
     Returns:
-        Extracted sample name
+        Tuple of sample name parts
     """
-    name = filename
-
     # Remove common file extensions
-    extensions = [".fastq.gz", ".fq.gz", ".fastq", ".fq"]
-    for ext in extensions:
-        if name.endswith(ext):
-            name = name[: -len(ext)]
-            break
+    name = _READ_EXT_RE.sub("", filename, count=1)
 
-    # Remove all forward/reverse tags
-    for tag in forward_tags + reverse_tags:
-        name = name.replace(tag, "")
+    # Remove all forward/reverse tags, then apply strip strings
+    name, _ = _replace_literals(name, (*forward_tags, *reverse_tags), "")
+    name, _ = _replace_literals(name, strip_strings, "")
 
-    # Apply strip strings
-    for strip_str in strip_strings:
-        name = name.replace(strip_str, "")
-
-    # Split by separators and rejoin
+    # Split by each separator in turn and rejoin with the first separator
     parts = [name]
-    for sep in separators:
-        new_parts = []
-        for part in parts:
-            new_parts.extend(part.split(sep))
-        parts = new_parts
-
-    # Rejoin with first separator
+    for split_sep in separators:
+        parts = [piece for part in parts for piece in part.split(split_sep)]
     sep = separators[0] if separators else "_"
-    name = sep.join(parts)
+    joined = sep.join(parts)
 
     # Strip non-alphanumeric from start/end
-    name = strip_non_alphanumeric(name)
+    name = strip_non_alphanumeric(joined)
+
+    # The split parts can be reused when nothing was stripped and they cannot
+    # contain the (single-character) separator; otherwise split the final name
+    if separators and len(sep) == 1 and name == joined:
+        return tuple(parts)
+    return tuple(name.split(sep))
+
+
+def extract_sample_name(
+    filename: str,
+    separators: tuple[str, ...],
+    forward_tags: tuple[str, ...],
+    reverse_tags: tuple[str, ...],
+    strip_strings: tuple[str, ...],
+) -> str:
+    """Extract sample name from filename.
+
+    Results are cached, so all arguments must be hashable (pass tuples).
+
+    Args:
+        filename: Filename (without directory)
+        separators: Characters to use for splitting
+        forward_tags: Tags indicating forward reads
+        reverse_tags: Tags indicating reverse reads
+        strip_strings: Strings to remove from anywhere in name
 
-    return name
+    Returns:
+        Extracted sample name
+    """
+    parts = _tokenize_sample_name(filename, separators, forward_tags, reverse_tags, strip_strings)
+    sep = separators[0] if separators else "_"
+    return sep.join(parts)
 
 
 def find_first_unique_parts(sample_names: list[str], separator: str = "_") -> dict[str, str]:
@@ -244,31 +456,33 @@ def find_first_unique_parts(sample_names: list[str], separator: str = "_") -> di
     Returns:
         Dictionary mapping original name to unique part
     """
-    if not sample_names:
+    return _first_unique_parts({name: name.split(separator) for name in sample_names})
+
+
+def _first_unique_parts(name_parts: dict[str, Sequence[str]]) -> dict[str, str]:
+    """Find the first unique part of each sample name from its split parts.
+
+    Args:
+        name_parts: Dictionary mapping sample name to its parts
+
+    Returns:
+        Dictionary mapping original name to unique part
+    """
+    if not name_parts:
         return {}
 
-    # Split all names into parts
-    name_parts = {}
-    for name in sample_names:
-        parts = name.split(separator)
-        name_parts[name] = parts
+    # Count how often each part occurs at each position across all samples
+    max_len = max(map(len, name_parts.values()))
+    column_counts = [
+        Counter(parts[i] for parts in name_parts.values() if i < len(parts)) for i in range(max_len)
+    ]
 
-    # Find first position where names differ
+    # For each name, pick the first part not shared by any other sample at
+    # the same position
     result = {}
     for name, parts in name_parts.items():
-        # Try each part until we find one that's unique
         for i, part in enumerate(parts):
-            # Check if this part is unique among all samples
-            unique = True
-            for other_name, other_parts in name_parts.items():
-                if other_name == name:
-                    continue
-                # If other sample has same part at same position, not unique
-                if i < len(other_parts) and other_parts[i] == part:
-                    unique = False
-                    break
-
-            if unique:
+            if column_counts[i][part] == 1:
                 result[name] = part
                 break
         else:
@@ -278,14 +492,44 @@ def find_first_unique_parts(sample_names: list[str], separator: str = "_") -> di
     return result
 
 
+def _scan_directory(path: Path, ext_tuple: tuple[str, ...]) -> dict[str, str]:
+    """Scan a single directory (non-recursive) for read files.
+
+    Args:
+        path: Directory to scan
+        ext_tuple: Valid file extensions
+
+    Returns:
+        Dictionary mapping filename to path string (as found under its directory)
+    """
+    files = {}
+
+    # DirEntry caches the file type from the directory listing, avoiding a
+    # stat() per entry
+    with os.scandir(path) as entries:
+        for entry in entries:
+            # Check extension before touching the file type
+            if not entry.name.endswith(ext_tuple) or not entry.is_file():
+                continue
+
+            # Keep the plain path string; SequencedSample builds the Path
+            # and resolves it
+            files[entry.name] = entry.path
+
+    return files
+
+
 def scan_directories(
     paths: list[Path],
-    extensions: list[str],
-    forward_tags: list[str],
-    reverse_tags: list[str],
-) -> dict[str, Path]:
+    extensions: Sequence[str],
+    forward_tags: Sequence[str],
+    reverse_tags: Sequence[str],
+) -> dict[str, str]:
     """Scan directories for read files.
 
+    Multiple directories are scanned concurrently in threads, as listing them
+    is I/O bound.
+
     Args:
         paths: List of directories to scan
         extensions: Valid file extensions
@@ -293,36 +537,36 @@ def scan_directories(
         reverse_tags: Tags indicating reverse reads
 
     Returns:
-        Dictionary mapping filename to absolute path
+        Dictionary mapping filename to path string (as found under its directory)
     """
-    files = {}
-
     for path in paths:
         if not path.is_dir():
             raise ValueError(f"Path is not a directory: {path}")
 
-        # Scan directory (non-recursive)
-        for file_path in path.iterdir():
-            if not file_path.is_file():
-                continue
+    # str.endswith() checks a tuple of suffixes in a single call
+    ext_tuple = tuple(extensions)
 
-            # Check extension
-            filename = file_path.name
-            has_valid_ext = any(filename.endswith(ext) for ext in extensions)
-            if not has_valid_ext:
-                continue
+    if not paths:
+        return {}
+    if len(paths) == 1:
+        return _scan_directory(paths[0], ext_tuple)
 
-            files[filename] = file_path.resolve()
+    # Merge in input order, so a filename found in several directories keeps
+    # the path from the last one
+    files = {}
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        for found in executor.map(_scan_directory, paths, repeat(ext_tuple)):
+            files.update(found)
 
     return files
 
 
 def pair_reads(
-    files: dict[str, Path],
-    forward_tags: list[str],
-    reverse_tags: list[str],
+    files: dict[str, str],
+    forward_tags: Sequence[str],
+    reverse_tags: Sequence[str],
     force_single_end: bool = False,
-) -> tuple[dict[str, tuple[Path, Path | None]], list[str]]:
+) -> tuple[dict[str, tuple[str, str | None]], list[str]]:
     """Pair forward and reverse reads.
 
     Args:
@@ -340,27 +584,29 @@ def pair_reads(
     reverse_reads = {}
     unpaired = []
 
-    for filename, filepath in files.items():
-        # Check if forward
-        is_forward = any(tag in filename for tag in forward_tags)
-        # Check if reverse
-        is_reverse = any(tag in filename for tag in reverse_tags)
+    # Detecting a tag and replacing it is a single step per direction
+    forward_tags = tuple(forward_tags)
+    reverse_tags = tuple(reverse_tags)
 
-        if force_single_end or (not is_forward and not is_reverse):
-            # Treat as single-end
+    for filename, filepath in files.items():
+        if force_single_end:
             unpaired.append(filename)
-        elif is_forward:
-            # Remove forward tag to get base name
-            base_name = filename
-            for tag in forward_tags:
-                base_name = base_name.replace(tag, "___PAIR___")
+            continue
+
+        # Check if forward, replacing the tag to get the base name
+        base_name, found = _replace_literals(filename, forward_tags, "___PAIR___")
+        if found:
             forward_reads[base_name] = filepath
-        elif is_reverse:
-            # Remove reverse tag to get base name
-            base_name = filename
-            for tag in reverse_tags:
-                base_name = base_name.replace(tag, "___PAIR___")
+            continue
+
+        # Check if reverse
+        base_name, found = _replace_literals(filename, reverse_tags, "___PAIR___")
+        if found:
             reverse_reads[base_name] = filepath
+            continue
+
+        # Neither forward nor reverse: treat as single-end
+        unpaired.append(filename)
 
     # Pair up forward and reverse
     paired = {}
@@ -371,18 +617,18 @@ def pair_reads(
     # Add orphan reverse reads as unpaired
     for base_name, reverse_path in reverse_reads.items():
         if base_name not in forward_reads:
-            unpaired.append(reverse_path.name)
+            unpaired.append(os.path.basename(reverse_path))
 
     return paired, unpaired
 
 
 def build_sequenced_run(
     paths: list[Path],
-    extensions: list[str],
-    forward_tags: list[str],
-    reverse_tags: list[str],
-    separators: list[str],
-    strip_strings: list[str],
+    extensions: Sequence[str],
+    forward_tags: Sequence[str],
+    reverse_tags: Sequence[str],
+    separators: Sequence[str],
+    strip_strings: Sequence[str],
     force_single_end: bool = False,
 ) -> SequencedRun:
     """Build a SequencedRun from directory scanning.
@@ -405,6 +651,12 @@ def build_sequenced_run(
     pwd = Path.cwd()
     run = SequencedRun()
 
+    # Tuples are hashable, as required by the cached _tokenize_sample_name
+    forward_tags = tuple(forward_tags)
+    reverse_tags = tuple(reverse_tags)
+    separators = tuple(separators)
+    strip_strings = tuple(strip_strings)
+
     # Scan directories
     files = scan_directories(paths, extensions, forward_tags, reverse_tags)
 
@@ -414,37 +666,50 @@ def build_sequenced_run(
     # Pair reads
     paired, unpaired = pair_reads(files, forward_tags, reverse_tags, force_single_end)
 
+    # Sample names are built from their parts, which are kept for the
+    # unique-part search below instead of splitting the names again
+    sep = separators[0] if separators else "_"
+    name_parts = {}
+
+    all_samples = {}
+
+    def add_reads(sample_name: str, reads: tuple[str, ...]):
+        # Later files win on a name clash, but say so rather than silently
+        # dropping reads
+        if sample_name in all_samples:
+            logger.warning(
+                f"Sample name {sample_name} matches several read files; "
+                f"using {os.path.basename(reads[0])}"
+            )
+        all_samples[sample_name] = reads
+
     # Process paired reads
-    paired_samples = {}
     for base_name, (forward_path, reverse_path) in paired.items():
         # Extract sample name from forward read
-        sample_name = extract_sample_name(
-            forward_path.name, separators, forward_tags, reverse_tags, strip_strings
+        parts = _tokenize_sample_name(
+            os.path.basename(forward_path), separators, forward_tags, reverse_tags, strip_strings
         )
+        sample_name = sep.join(parts)
+        name_parts[sample_name] = parts
 
         if reverse_path:
             # Paired-end
-            paired_samples[sample_name] = (forward_path, reverse_path)
+            add_reads(sample_name, (forward_path, reverse_path))
         else:
             # Forward only, treat as SE
-            paired_samples[sample_name] = (forward_path,)
+            add_reads(sample_name, (forward_path,))
 
     # Process unpaired reads
-    unpaired_samples = {}
     for filename in unpaired:
-        sample_name = extract_sample_name(
+        parts = _tokenize_sample_name(
             filename, separators, forward_tags, reverse_tags, strip_strings
         )
-        unpaired_samples[sample_name] = (files[filename],)
-
-    # Combine all samples
-    all_samples = {}
-    all_samples.update(paired_samples)
-    all_samples.update(unpaired_samples)
+        sample_name = sep.join(parts)
+        name_parts[sample_name] = parts
+        add_reads(sample_name, (files[filename],))
 
     # Find first unique parts
-    sep = separators[0] if separators else "_"
-    unique_names = find_first_unique_parts(list(all_samples.keys()), sep)
+    unique_names = _first_unique_parts(name_parts)
 
     # Create SequencedSample objects
     for original_name, reads_tuple in all_samples.items():
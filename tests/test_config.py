@@ -52,3 +52,42 @@ def test_config_set_with_section():
         result = runner.invoke(cli, ["--config", "test_config.ini", "config"])
         assert result.exit_code == 0
         assert "mysection" in result.stderr
+
+
+def test_config_set_creates_parent_directory(tmp_path):
+    """Test that saving creates missing directories and leaves no temporary file."""
+    runner = CliRunner()
+    config_file = tmp_path / "nested" / "qimu.ini"
+
+    result = runner.invoke(cli, ["--config", str(config_file), "config", "--set", "key", "value"])
+
+    assert result.exit_code == 0
+    assert config_file.read_text().startswith("[qimu]")
+    assert [p.name for p in config_file.parent.iterdir()] == ["qimu.ini"]
+
+
+def test_config_set_follows_symlink(tmp_path):
+    """Test that saving through a symlink updates the target and keeps its mode."""
+    runner = CliRunner()
+    target = tmp_path / "dotfiles" / "qimu.ini"
+    target.parent.mkdir()
+    target.write_text("[qimu]\nk1 = v1\n")
+    target.chmod(0o600)
+    link = tmp_path / "link.ini"
+    link.symlink_to(target)
+
+    result = runner.invoke(cli, ["--config", str(link), "config", "--set", "k2", "v2"])
+
+    assert result.exit_code == 0
+    assert link.is_symlink()
+    assert "k2 = v2" in target.read_text()
+    assert target.stat().st_mode & 0o777 == 0o600
+
+
+def test_config_help_keeps_section_brackets():
+    """Test that literal square brackets survive Rich markup in help text."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["config", "--help"], terminal_width=200)
+
+    assert result.exit_code == 0
+    assert "just param for [qimu] section" in result.output
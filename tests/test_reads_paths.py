@@ -0,0 +1,161 @@
+"""Tests for read path utilities."""
+
+import io
+
+import pytest
+
+from qimu.utils.reads_paths import (
+    ReadType,
+    SequencedRun,
+    SequencedSample,
+    extract_sample_name,
+    find_first_unique_parts,
+    pair_reads,
+    scan_directories,
+)
+
+FORWARD_TAGS = ("_R1_", "_1.")
+REVERSE_TAGS = ("_R2_", "_2.")
+
+
+def test_extract_sample_name_illumina():
+    """Test sample name extraction from Illumina-style filenames."""
+    name = extract_sample_name(
+        "Sample1_S20_R1_L001.fastq.gz", ("_",), FORWARD_TAGS, REVERSE_TAGS, ()
+    )
+
+    assert name == "Sample1_S20L001"
+
+
+def test_extract_sample_name_strip_and_separators():
+    """Test that strip strings are removed and all separators are normalised."""
+    name = extract_sample_name(
+        "PID100_Sample1-lane2_1.fq", ("_", "-"), FORWARD_TAGS, REVERSE_TAGS, ("PID100_",)
+    )
+
+    assert name == "Sample1_lane2_1"
+
+
+def test_extract_sample_name_tags_before_strip_strings():
+    """Test that tags are removed before strip strings, even when they overlap."""
+    name = extract_sample_name(
+        "Sample1_S20_R1_L001.fastq.gz", ("_",), FORWARD_TAGS, REVERSE_TAGS, ("_S20_",)
+    )
+
+    assert name == "Sample1_S20L001"
+
+
+def test_extract_sample_name_nested_tags():
+    """Test that tags containing one another are removed in the order given."""
+    cases = [
+        (("_R1", "_R1_"), "S1_001"),
+        (("_R1_", "_R1"), "S1001"),
+        (("R1", "_R1_"), "S1__001"),
+    ]
+    for forward_tags, expected in cases:
+        name = extract_sample_name("S1_R1_001.fastq.gz", ("_",), forward_tags, REVERSE_TAGS, ())
+
+        assert name == expected
+
+
+def test_extract_sample_name_separators_in_order():
+    """Test that separators are applied in the order given."""
+    name = extract_sample_name("a__b_c.fastq", ("_", "__"), FORWARD_TAGS, REVERSE_TAGS, ())
+
+    assert name == "a__b_c"
+
+
+def test_extract_sample_name_empty_separator():
+    """Test that an empty separator is rejected."""
+    with pytest.raises(ValueError):
+        extract_sample_name("Sample1.fastq", ("",), FORWARD_TAGS, REVERSE_TAGS, ())
+
+
+def test_find_first_unique_parts():
+    """Test that each name maps to its first part unique at that position."""
+    names = ["Sample1_S20_L001", "Sample2_S21_L001", "Sample1_S22_L001", "Run_A", "Run_A_x"]
+
+    result = find_first_unique_parts(names)
+
+    assert result == {
+        "Sample1_S20_L001": "S20",
+        "Sample2_S21_L001": "Sample2",
+        "Sample1_S22_L001": "S22",
+        "Run_A": "Run_A",
+        "Run_A_x": "x",
+    }
+
+
+def test_pair_reads_nested_tags():
+    """Test that nested tags build base names in the order given, as before."""
+    files = {"S1_R1_001.fastq": "d/S1_R1_001.fastq", "S1_R2_001.fastq": "d/S1_R2_001.fastq"}
+
+    paired, unpaired = pair_reads(files, ("_R1_",), ("_R2_",))
+    assert paired == {"S1___PAIR___001.fastq": ("d/S1_R1_001.fastq", "d/S1_R2_001.fastq")}
+    assert unpaired == []
+
+    # "_R1" is replaced first, leaving a "_" that the reverse base name lacks
+    paired, unpaired = pair_reads(files, ("_R1", "_R1_"), ("_R2_",))
+    assert paired == {"S1___PAIR____001.fastq": ("d/S1_R1_001.fastq", None)}
+    assert unpaired == ["S1_R2_001.fastq"]
+
+
+def test_sequenced_sample_get_reads(tmp_path):
+    """Test absolute, PWD-relative and directory-relative read paths."""
+    reads_dir = tmp_path / "reads"
+    reads_dir.mkdir()
+    reads = [reads_dir / "S1_R1.fastq", reads_dir / "S1_R2.fastq"]
+    for read in reads:
+        read.touch()
+
+    sample = SequencedSample("S1", ReadType.PAIRED_END, reads, pwd=tmp_path.resolve())
+
+    expected_abs = [str(r.resolve()) for r in reads]
+    assert sample.get_reads(absolute=True) == expected_abs
+    assert sample.get_reads() == ["reads/S1_R1.fastq", "reads/S1_R2.fastq"]
+    assert sample.get_reads(relative_to=reads_dir.resolve()) == ["S1_R1.fastq", "S1_R2.fastq"]
+    # Cached results are returned as fresh lists
+    sample.get_reads().clear()
+    assert sample.get_reads() == ["reads/S1_R1.fastq", "reads/S1_R2.fastq"]
+
+
+def test_sequenced_run_write_table(tmp_path):
+    """Test that write_table streams the same table as to_table."""
+    run = SequencedRun()
+    assert run.to_table() == ""
+
+    for sample_id in ("S2", "S1"):
+        reads = [tmp_path / f"{sample_id}_R1.fastq", tmp_path / f"{sample_id}_R2.fastq"]
+        run.add_sample(
+            SequencedSample(sample_id, ReadType.PAIRED_END, reads, pwd=tmp_path.resolve())
+        )
+
+    out = io.StringIO()
+    run.write_table(out, separator=",")
+    assert out.getvalue() == run.to_table(separator=",")
+    assert out.getvalue().split("\n") == [
+        "SampleId,reads_R1,reads_R2",
+        "S1,S1_R1.fastq,S1_R2.fastq",
+        "S2,S2_R1.fastq,S2_R2.fastq",
+    ]
+
+
+def test_scan_directories_merges_in_order(tmp_path):
+    """Test that several directories are merged and the last one wins on clashes."""
+    dir_a = tmp_path / "a"
+    dir_b = tmp_path / "b"
+    for directory, names in ((dir_a, ("A_R1_001.fastq", "A_R2_001.fastq")), (dir_b, ("B.fastq",))):
+        directory.mkdir()
+        for name in (*names, "shared.fastq", "notes.txt"):
+            (directory / name).touch()
+
+    files = scan_directories([dir_a, dir_b], (".fastq",), FORWARD_TAGS, REVERSE_TAGS)
+
+    assert sorted(files) == ["A_R1_001.fastq", "A_R2_001.fastq", "B.fastq", "shared.fastq"]
+    assert files["A_R1_001.fastq"] == str(dir_a / "A_R1_001.fastq")
+    assert files["B.fastq"] == str(dir_b / "B.fastq")
+    assert files["shared.fastq"] == str(dir_b / "shared.fastq")
+
+    files = scan_directories([dir_b, dir_a], (".fastq",), FORWARD_TAGS, REVERSE_TAGS)
+
+    assert files["shared.fastq"] == str(dir_a / "shared.fastq")
@@ -80,7 +80,7 @@ def test_reads_table_single_end_project():
     assert "Sample2" in result.output
 
 
-def test_reads_table_force_single_end():
+def test_reads_table_force_single_end(caplog):
     """Test reads-table with --single-end flag on paired reads."""
     runner = CliRunner()
     test_dir = Path(__file__).parent / "reads" / "pe1"
@@ -90,6 +90,8 @@ def test_reads_table_force_single_end():
     assert result.exit_code == 0
     # With --single-end, should treat all files as single-end
     assert "SampleId\treads_R1" in result.output
+    # R1 and R2 files collapse to the same sample name, which is reported
+    assert "matches several read files" in caplog.text
 
 
 def test_reads_table_absolute_paths():
@@ -231,6 +233,25 @@ def test_reads_table_multiple_directories():
     assert "Sample1" in result.output
 
 
+def test_reads_table_two_directories(tmp_path, monkeypatch):
+    """Test that samples from several directories are merged into one table."""
+    for directory, sample in (("run1", "SampleA"), ("run2", "SampleB")):
+        (tmp_path / directory).mkdir()
+        for tag in ("R1", "R2"):
+            (tmp_path / directory / f"{sample}_S1_{tag}_001.fastq.gz").touch()
+    monkeypatch.chdir(tmp_path)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["reads-table", "run1", "run2"])
+
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == [
+        "SampleId\treads_R1\treads_R2",
+        "SampleA\trun1/SampleA_S1_R1_001.fastq.gz\trun1/SampleA_S1_R2_001.fastq.gz",
+        "SampleB\trun2/SampleB_S1_R1_001.fastq.gz\trun2/SampleB_S1_R2_001.fastq.gz",
+    ]
+
+
 def test_reads_table_duplicate_samples_error():
     """Test that duplicate sample IDs are properly caught."""
     runner = CliRunner()
@@ -330,3 +351,50 @@ def test_reads_table_verbose_mode():
     # Verbose mode should work without errors and produce valid output
     assert "SampleId" in result.output
     assert "Sample1" in result.output
+
+
+def test_reads_table_format_unknown():
+    """Test reads-table with an unknown --format preset."""
+    runner = CliRunner()
+    test_dir = Path(__file__).parent / "reads" / "pe1"
+
+    result = runner.invoke(cli, ["reads-table", str(test_dir), "--format", "nope"])
+
+    assert result.exit_code == 1
+    assert "Unknown format: nope" in result.stderr
+    assert "manifest, ampliseq, mag" in result.stderr
+
+
+def test_reads_table_symlinked_orphan_reverse(tmp_path):
+    """Test that a symlinked reverse read without a forward mate is listed."""
+    runner = CliRunner()
+    target = tmp_path / "data" / "target.fastq"
+    target.parent.mkdir()
+    target.touch()
+    reads_dir = tmp_path / "reads"
+    reads_dir.mkdir()
+    (reads_dir / "Orphan_R2_.fastq").symlink_to(target)
+
+    result = runner.invoke(cli, ["reads-table", str(reads_dir), "--abs"])
+
+    assert result.exit_code == 0
+    assert f"Orphan\t{target.resolve()}" in result.output
+
+
+def test_reads_table_outside_pwd_writes_nothing(tmp_path, monkeypatch):
+    """Test that a relative path error leaves stdout empty."""
+    reads_dir = tmp_path / "reads"
+    reads_dir.mkdir()
+    for name in ("S1_R1_001.fastq", "S1_R2_001.fastq"):
+        (reads_dir / name).touch()
+
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["reads-table", str(reads_dir)])
+
+    assert result.exit_code == 1
+    assert result.stdout == ""
+    assert "Error" in result.stderr
@@ -1,9 +1,11 @@
 """Tests for version command."""
 
+import pytest
 from click.testing import CliRunner
 
 import qimu
-from qimu.cli import cli
+from qimu import cli as cli_module
+from qimu.cli import cli, main
 
 
 def test_version_simple():
@@ -44,3 +46,38 @@ def test_help_shorthand_subcommand():
     assert result.exit_code == 0
     assert "Print the version to STDOUT" in result.output
     assert "Options" in result.output
+
+
+def test_help_lists_lazy_subcommands():
+    """Test that lazily registered subcommands are listed in the main help."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    for name in ("version", "config", "reads-table"):
+        assert name in result.output
+
+
+def test_main_version_fast_path(monkeypatch, capsys):
+    """Test that a bare "qimu version" prints the version without invoking click."""
+
+    def fail_cli():
+        raise AssertionError("click should not be invoked")
+
+    monkeypatch.setattr("sys.argv", ["qimu", "version"])
+    monkeypatch.setattr(cli_module, "cli", fail_cli)
+
+    main()
+
+    assert capsys.readouterr().out == f"{qimu.__version__}\n"
+
+
+def test_main_version_full_uses_click(monkeypatch, capsys):
+    """Test that "qimu version --full" still goes through click."""
+    monkeypatch.setattr("sys.argv", ["qimu", "version", "--full"])
+
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+
+    assert excinfo.value.code == 0
+    assert f"qimu {qimu.__version__}" in capsys.readouterr().out